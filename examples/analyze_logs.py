@@ -10,44 +10,118 @@ Usage:
 """
 
 import json
+import mmap
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 import sys
 
-
-def load_logs(log_dir: Path = Path("logs")) -> List[Dict[str, Any]]:
+# orjson parses several times faster than the stdlib; fall back to json
+# when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+@dataclass
+class _LogView:
+    """Projection of a log file onto the fields the summary actually uses.
+
+    Everything else in the log (notably the per-layer `phases` subtree,
+    which is only needed with --verbose) is dropped right after parsing
+    so it can be reclaimed immediately.
+    """
+    metadata: Dict[str, Any]
+    model: Dict[str, Any]
+    timing: Dict[str, Any]
+    results: Dict[str, Any]
+    status: str
+    error: Optional[str]
+    phases: Optional[Dict[str, Any]]
+    path: str
+    # Cached copy of metadata['timestamp_start'], used as a sort key.
+    timestamp_start: str
+
+
+# Logs above this size are memory-mapped instead of read into a fresh
+# buffer, so the parser works straight off the page cache.
+_MMAP_THRESHOLD = 1 << 20  # 1 MiB
+
+
+def _read_log_bytes(log_file: Path) -> Dict[str, Any]:
+    """Read and parse a log file, memory-mapping it when large."""
+    if log_file.stat().st_size < _MMAP_THRESHOLD:
+        return _loads(log_file.read_bytes())
+
+    with open(log_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # orjson accepts any buffer; the stdlib json needs bytes.
+            return _loads(memoryview(mm) if orjson is not None else mm[:])
+
+
+def _read_log(log_file: Path, verbose: bool) -> _LogView:
+    """Read and project a single log file."""
+    data = _read_log_bytes(log_file)
+    return _LogView(
+        metadata=data['metadata'],
+        model=data['model'],
+        timing=data.get('timing', {}),
+        results=data.get('results', {}),
+        status=data['status'],
+        error=data.get('error'),
+        phases=data.get('phases') if verbose else None,
+        path=str(log_file),
+        timestamp_start=data['metadata']['timestamp_start'],
+    )
+
+
+def load_logs(log_dir: Path = Path("logs"),
+              verbose: bool = False) -> List[_LogView]:
     """Load all JSON log files from the logs directory."""
     if not log_dir.exists():
         print(f"Error: Log directory '{log_dir}' does not exist")
         return []
 
+    # Reads and parses of separate files are independent and release the
+    # GIL, so overlap them with a thread pool. Results are collected in
+    # filename order to keep the output deterministic.
+    log_files = sorted(log_dir.glob("*.json"))
     logs = []
-    for log_file in sorted(log_dir.glob("*.json")):
-        try:
-            with open(log_file, 'r') as f:
-                data = json.load(f)
-                data['_log_file'] = str(log_file)
-                logs.append(data)
-        except Exception as e:
-            print(f"Warning: Failed to load {log_file}: {e}", file=sys.stderr)
-
+    with ThreadPoolExecutor() as pool:
+        futures = [pool.submit(_read_log, f, verbose) for f in log_files]
+        for log_file, future in zip(log_files, futures):
+            try:
+                logs.append(future.result())
+            except Exception as e:
+                print(f"Warning: Failed to load {log_file}: {e}", file=sys.stderr)
+
+    # Sort by start time once here; the display and filter paths rely on
+    # this ordering instead of re-sorting.
+    logs.sort(key=lambda log: log.timestamp_start)
     return logs
 
 
-def filter_latest(logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Keep only the most recent log for each benchmark."""
-    benchmark_map = {}
-    for log in logs:
-        name = log['metadata']['benchmark_name']
-        timestamp = log['metadata']['timestamp_start']
-        if name not in benchmark_map or timestamp > benchmark_map[name]['metadata']['timestamp_start']:
-            benchmark_map[name] = log
-    return list(benchmark_map.values())
+def filter_latest(logs: List[_LogView]) -> List[_LogView]:
+    """Keep only the most recent log for each benchmark.
 
+    load_logs returns logs sorted by start time, so one dict comprehension
+    that keeps the last entry per name selects the latest run without any
+    per-log timestamp comparisons. The dict ends up ordered by each name's
+    first appearance, so the survivors are re-sorted by start time.
+    """
+    name_of = itemgetter('benchmark_name')
+    latest = {name_of(log.metadata): log for log in logs}
+    return sorted(latest.values(), key=lambda log: log.timestamp_start)
 
-def print_summary(logs: List[Dict[str, Any]], verbose: bool = False):
+
+def print_summary(logs: List[_LogView], verbose: bool = False):
     """Print a formatted summary of benchmark results."""
     if not logs:
         print("No logs found.")
@@ -57,12 +131,18 @@ def print_summary(logs: List[Dict[str, Any]], verbose: bool = False):
     print(f"BENCHMARK SUMMARY - {len(logs)} log(s)")
     print(f"{'='*80}\n")
 
-    for log in sorted(logs, key=lambda x: x['metadata']['timestamp_start']):
-        meta = log['metadata']
-        model = log['model']
-        timing = log.get('timing', {})
-        results = log.get('results', {})
-        status = log['status']
+    # Aggregate statistics in the same pass that renders each log.
+    num_successful = 0
+    total_time = 0.0
+    fhe_time = 0.0
+
+    # load_logs already returns logs sorted by start time.
+    for log in logs:
+        meta = log.metadata
+        model = log.model
+        timing = log.timing
+        results = log.results
+        status = log.status
 
         # Status indicator
         status_symbol = "✓" if status == "success" else "✗"
@@ -75,16 +155,19 @@ def print_summary(logs: List[Dict[str, Any]], verbose: bool = False):
         print(f"  Started:     {meta['timestamp_start']}")
 
         if status == "success":
+            num_successful += 1
+            total_time += timing.get('total_duration_seconds', 0)
+            fhe_time += timing.get('fhe_inference_only', 0)
             print(f"  Duration:    {timing.get('total_duration_seconds', 0):.2f}s ({timing.get('total_duration_seconds', 0)/60:.2f}m)")
             print(f"  FHE Time:    {timing.get('fhe_inference_only', 0):.2f}s")
             print(f"  MAE:         {results.get('mae', 'N/A'):.6f}")
             print(f"  Precision:   {results.get('precision_bits', 'N/A'):.2f} bits")
         else:
-            print(f"  Error:       {log.get('error', 'Unknown error')}")
+            print(f"  Error:       {log.error or 'Unknown error'}")
 
         if verbose:
             print(f"\n  Phase Breakdown:")
-            phases = log.get('phases', {})
+            phases = log.phases or {}
             for phase_name, phase_data in phases.items():
                 duration = phase_data.get('duration_seconds', 0)
                 status_str = phase_data.get('status', 'unknown')
@@ -93,50 +176,55 @@ def print_summary(logs: List[Dict[str, Any]], verbose: bool = False):
         print()
 
     # Overall statistics
-    successful = [l for l in logs if l['status'] == 'success']
-    if successful:
+    if num_successful:
         print(f"{'='*80}")
         print(f"STATISTICS")
         print(f"{'='*80}")
         print(f"  Total benchmarks:     {len(logs)}")
-        print(f"  Successful:           {len(successful)}")
-        print(f"  Failed:               {len(logs) - len(successful)}")
-
-        total_time = sum(l.get('timing', {}).get('total_duration_seconds', 0) for l in successful)
-        fhe_time = sum(l.get('timing', {}).get('fhe_inference_only', 0) for l in successful)
-
+        print(f"  Successful:           {num_successful}")
+        print(f"  Failed:               {len(logs) - num_successful}")
         print(f"  Total time:           {total_time:.2f}s ({total_time/60:.2f}m)")
         print(f"  Total FHE time:       {fhe_time:.2f}s ({fhe_time/60:.2f}m)")
-        print(f"  Avg time/benchmark:   {total_time/len(successful):.2f}s")
+        print(f"  Avg time/benchmark:   {total_time/num_successful:.2f}s")
         print()
 
 
-def export_summary(logs: List[Dict[str, Any]], output_file: Path):
+def export_summary(logs: List[_LogView], output_file: Path):
     """Export a compact summary to JSON."""
+    # Single pass over the logs: count statuses and emit each benchmark
+    # row as it is serialized, with no staging list to append to first.
+    num_successful = num_failed = 0
+    for log in logs:
+        if log.status == 'success':
+            num_successful += 1
+        elif log.status == 'failed':
+            num_failed += 1
+
     summary = {
         "generated_at": datetime.now().isoformat(),
         "total_benchmarks": len(logs),
-        "successful": len([l for l in logs if l['status'] == 'success']),
-        "failed": len([l for l in logs if l['status'] == 'failed']),
-        "benchmarks": []
+        "successful": num_successful,
+        "failed": num_failed,
+        "benchmarks": [{
+            "name": log.metadata['benchmark_name'],
+            "model": log.model.get('name'),
+            "dataset": log.model.get('dataset'),
+            "status": log.status,
+            "timestamp": log.timestamp_start,
+            "total_time_seconds": log.timing.get('total_duration_seconds', 0),
+            "fhe_time_seconds": log.timing.get('fhe_inference_only', 0),
+            "mae": log.results.get('mae'),
+            "precision_bits": log.results.get('precision_bits'),
+            "log_file": log.path
+        } for log in logs]
     }
 
-    for log in logs:
-        summary['benchmarks'].append({
-            "name": log['metadata']['benchmark_name'],
-            "model": log['model'].get('name'),
-            "dataset": log['model'].get('dataset'),
-            "status": log['status'],
-            "timestamp": log['metadata']['timestamp_start'],
-            "total_time_seconds": log.get('timing', {}).get('total_duration_seconds', 0),
-            "fhe_time_seconds": log.get('timing', {}).get('fhe_inference_only', 0),
-            "mae": log.get('results', {}).get('mae'),
-            "precision_bits": log.get('results', {}).get('precision_bits'),
-            "log_file": log.get('_log_file')
-        })
-
-    with open(output_file, 'w') as f:
-        json.dump(summary, f, indent=2)
+    if orjson is not None:
+        output_file.write_bytes(
+            orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(summary, f, indent=2)
 
     print(f"Summary exported to: {output_file}")
 
@@ -157,14 +245,14 @@ def main():
     args = parser.parse_args()
 
     # Load logs
-    logs = load_logs(args.log_dir)
+    logs = load_logs(args.log_dir, verbose=args.verbose)
 
     if not logs:
         sys.exit(1)
 
     # Apply filters
     if args.benchmark:
-        logs = [l for l in logs if args.benchmark.lower() in l['metadata']['benchmark_name'].lower()]
+        logs = [l for l in logs if args.benchmark.lower() in l.metadata['benchmark_name'].lower()]
         if not logs:
             print(f"No logs found matching '{args.benchmark}'")
             sys.exit(1)
@@ -9,9 +9,45 @@ import time
 import socket
 import platform
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
-import torch
+
+# torch is imported lazily in __init__: pulling it in at module import
+# costs hundreds of ms and tens of MB, which tools that only read logs
+# should not pay.
+
+# Prefer orjson for writing the final log; fall back to the stdlib.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_last_hms = (0, "")
+
+def _now_hms() -> str:
+    """Wall-clock HH:MM:SS for log prints, re-formatted at most once per
+    second instead of building a datetime object per print."""
+    global _last_hms
+    now = int(time.time())
+    if now != _last_hms[0]:
+        _last_hms = (now, time.strftime("%H:%M:%S"))
+    return _last_hms[1]
+
+
+@lru_cache(maxsize=1)
+def _host_metadata() -> Dict[str, Any]:
+    """Static host metadata, computed once per process.
+
+    platform.platform() in particular can shell out to uname; there is no
+    reason to redo that for every logger instance.
+    """
+    return {
+        "hostname": socket.gethostname(),
+        "platform": platform.platform(),
+        "python_version": platform.python_version(),
+    }
 
 
 class BenchmarkLogger:
@@ -66,21 +102,26 @@ class BenchmarkLogger:
     """
 
     def __init__(self, benchmark_name: str, log_dir: str = "logs"):
+        import torch
+
         self.benchmark_name = benchmark_name
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-        self.start_time = time.time()
+        # Durations come from the monotonic clock; datetime is only used
+        # for the human-readable timestamps persisted in the log.
+        self.start_time = time.monotonic()
         self.start_timestamp = datetime.now().isoformat()
 
+        host = _host_metadata()
         self.log_data = {
             "metadata": {
                 "benchmark_name": benchmark_name,
                 "timestamp_start": self.start_timestamp,
                 "timestamp_end": None,
-                "hostname": socket.gethostname(),
-                "platform": platform.platform(),
-                "python_version": platform.python_version(),
+                "hostname": host["hostname"],
+                "platform": host["platform"],
+                "python_version": host["python_version"],
                 "pytorch_version": torch.__version__,
                 "cuda_available": torch.cuda.is_available(),
                 "config_file": None
@@ -112,8 +153,8 @@ class BenchmarkLogger:
 
     def start_phase(self, phase_name: str):
         """Start timing a phase."""
-        self.phase_timers[phase_name] = time.time()
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] Starting {phase_name}...", flush=True)
+        self.phase_timers[phase_name] = time.monotonic()
+        print(f"[{_now_hms()}] Starting {phase_name}...", flush=True)
 
     def end_phase(self, phase_name: str, status: str = "success", **kwargs):
         """
@@ -127,7 +168,7 @@ class BenchmarkLogger:
         if phase_name not in self.phase_timers:
             raise ValueError(f"Phase {phase_name} was not started")
 
-        duration = time.time() - self.phase_timers[phase_name]
+        duration = time.monotonic() - self.phase_timers[phase_name]
 
         phase_data = {
             "duration_seconds": round(duration, 4),
@@ -136,26 +177,29 @@ class BenchmarkLogger:
         phase_data.update(kwargs)
 
         self.log_data["phases"][phase_name] = phase_data
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] Completed {phase_name} in {duration:.2f}s", flush=True)
+        print(f"[{_now_hms()}] Completed {phase_name} in {duration:.2f}s", flush=True)
 
     def set_results(self, mae: float, precision_bits: float,
-                    cleartext_output: torch.Tensor, fhe_output: torch.Tensor,
+                    cleartext_output: "torch.Tensor", fhe_output: "torch.Tensor",
                     sample_size: int = 5):
         """Record final results."""
-        # Convert tensors to lists for JSON serialization
-        clear_sample = cleartext_output.flatten()[:sample_size].tolist()
-        fhe_sample = fhe_output.flatten()[:sample_size].tolist()
+        # Round to 6 decimals in one tensor op, then convert to lists for
+        # JSON serialization.
+        clear_sample = (cleartext_output.flatten()[:sample_size]
+                        .double().mul(1e6).round().div(1e6).tolist())
+        fhe_sample = (fhe_output.flatten()[:sample_size]
+                      .double().mul(1e6).round().div(1e6).tolist())
 
         self.log_data["results"] = {
             "mae": round(mae, 6),
             "precision_bits": round(precision_bits, 4),
-            "cleartext_output_sample": [round(x, 6) for x in clear_sample],
-            "fhe_output_sample": [round(x, 6) for x in fhe_sample]
+            "cleartext_output_sample": clear_sample,
+            "fhe_output_sample": fhe_sample
         }
 
     def finalize(self, status: str = "success", error: Optional[str] = None):
         """Finalize the log and write to disk."""
-        end_time = time.time()
+        end_time = time.monotonic()
         total_duration = end_time - self.start_time
 
         self.log_data["metadata"]["timestamp_end"] = datetime.now().isoformat()
@@ -181,8 +225,12 @@ class BenchmarkLogger:
         log_filename = f"{self.benchmark_name}_{timestamp_str}.json"
         log_path = self.log_dir / log_filename
 
-        with open(log_path, 'w') as f:
-            json.dump(self.log_data, f, indent=2)
+        if orjson is not None:
+            log_path.write_bytes(
+                orjson.dumps(self.log_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(log_path, 'w') as f:
+                json.dump(self.log_data, f, indent=2)
 
         print(f"\n{'='*60}")
         print(f"Benchmark completed: {status.upper()}")
@@ -46,11 +46,18 @@ class LattigoFunction:
             return ctypes.c_float(arg)
         elif isinstance(arg, str):
             return arg.encode('utf-8')
-        elif (isinstance(arg, np.ndarray) and 
-            arg.dtype == np.uint8 and 
+        elif (isinstance(arg, np.ndarray) and
+            arg.dtype == np.uint8 and
             typ == ctypes.POINTER(ctypes.c_ubyte)):
             ptr = arg.ctypes.data_as(ctypes.POINTER(ctypes.c_ubyte))
             return (ptr, len(arg))
+        elif (isinstance(arg, np.ndarray) and
+            arg.dtype == np.float32 and
+            typ == ctypes.POINTER(ctypes.c_float)):
+            # Contiguous float32 buffers pass straight through with no
+            # per-element marshalling.
+            ptr = arg.ctypes.data_as(ctypes.POINTER(ctypes.c_float))
+            return (ptr, len(arg))
         elif isinstance(arg, list):
             if typ == ctypes.POINTER(ctypes.c_int):
                 return ((ctypes.c_int * len(arg))(*arg), len(arg))
@@ -358,6 +365,24 @@ class LattigoLibrary:
             restype=ctypes.c_int
         )
 
+        self.BatchEncrypt = LattigoFunction(
+            self.lib.BatchEncrypt,
+            argtypes=[
+                ctypes.POINTER(ctypes.c_int), ctypes.c_int,
+                ctypes.c_int, # num threads
+            ],
+            restype=ArrayResultInt
+        )
+
+        self.BatchDecrypt = LattigoFunction(
+            self.lib.BatchDecrypt,
+            argtypes=[
+                ctypes.POINTER(ctypes.c_int), ctypes.c_int,
+                ctypes.c_int, # num threads
+            ],
+            restype=ArrayResultInt
+        )
+
     def setup_evaluator(self):
         self.NewEvaluator = LattigoFunction(
             self.lib.NewEvaluator,
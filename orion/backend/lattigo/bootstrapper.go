@@ -8,6 +8,7 @@ import (
 	"math"
 
 	"github.com/baahl-nyu/lattigo/v6/circuits/ckks/bootstrapping"
+	"github.com/baahl-nyu/lattigo/v6/core/rlwe"
 	"github.com/baahl-nyu/lattigo/v6/utils"
 )
 
@@ -57,12 +58,25 @@ func NewBootstrapper(
 	bootstrapperMap[slots] = btpEval
 }
 
+// Scratch input buffers reused across Bootstrap calls, keyed by slot
+// count. Bootstrapping runs on a single Python thread, so no locking is
+// needed; the buffer only gets reallocated when the input level or
+// degree changes.
+var bootScratchMap = make(map[int]*rlwe.Ciphertext)
+
 //export Bootstrap
 func Bootstrap(ciphertextID, numSlots C.int) C.int {
 	ctIn := RetrieveCiphertext(int(ciphertextID))
 	bootstrapper := GetBootstrapper(int(numSlots))
 
-	ctBtp := ctIn.CopyNew()
+	slots := int(numSlots)
+	ctBtp, exists := bootScratchMap[slots]
+	if !exists || ctBtp.Degree() != ctIn.Degree() || ctBtp.Level() != ctIn.Level() {
+		ctBtp = ctIn.CopyNew()
+		bootScratchMap[slots] = ctBtp
+	} else {
+		ctBtp.Copy(ctIn)
+	}
 	ctBtp.LogDimensions.Cols = bootstrapper.LogMaxSlots()
 
 	ctOut, err := bootstrapper.Bootstrap(ctBtp)
@@ -90,4 +104,5 @@ func GetBootstrapper(numSlots int) *bootstrapping.Evaluator {
 //export DeleteBootstrappers
 func DeleteBootstrappers() {
 	bootstrapperMap = make(map[int]*bootstrapping.Evaluator)
+	bootScratchMap = make(map[int]*rlwe.Ciphertext)
 }
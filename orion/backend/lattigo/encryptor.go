@@ -3,6 +3,10 @@ package main
 import (
 	"C"
 
+	"runtime"
+	"sync"
+
+	"github.com/baahl-nyu/lattigo/v6/core/rlwe"
 	"github.com/baahl-nyu/lattigo/v6/schemes/ckks"
 )
 
@@ -36,3 +40,92 @@ func Decrypt(ciphertextID C.int) C.int {
 	idx := PushPlaintext(plaintext)
 	return C.int(idx)
 }
+
+// numWorkers clamps the requested thread count to a sensible pool size,
+// defaulting to all available cores when the request is <= 0.
+func numWorkers(numThreads, numJobs int) int {
+	workers := numThreads
+	if workers <= 0 {
+		workers = runtime.NumCPU()
+	}
+	if workers > numJobs {
+		workers = numJobs
+	}
+	return workers
+}
+
+//export BatchEncrypt
+func BatchEncrypt(plaintextIDs *C.int, numPlaintexts C.int, numThreads C.int) (*C.int, C.ulong) {
+	ptIDs := CArrayToSlice(plaintextIDs, numPlaintexts, convertCIntToInt)
+
+	// Encryptions of distinct plaintexts are independent, so fan them out
+	// over a worker pool. The output slice is pre-sized and each worker
+	// gets its own shallow copy of the encryptor, making writes race-free.
+	// Heap pushes stay on this thread since the allocator is not locked.
+	ciphertexts := make([]*rlwe.Ciphertext, len(ptIDs))
+	workers := numWorkers(int(numThreads), len(ptIDs))
+
+	var wg sync.WaitGroup
+	jobs := make(chan int, len(ptIDs))
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			encryptor := scheme.Encryptor.ShallowCopy()
+			for i := range jobs {
+				plaintext := RetrievePlaintext(ptIDs[i])
+				ciphertext := ckks.NewCiphertext(*scheme.Params, 1, plaintext.Level())
+				encryptor.Encrypt(plaintext, ciphertext)
+				ciphertexts[i] = ciphertext
+			}
+		}()
+	}
+	for i := range ptIDs {
+		jobs <- i
+	}
+	close(jobs)
+	wg.Wait()
+
+	ciphertextIDs := make([]int, len(ciphertexts))
+	for i, ciphertext := range ciphertexts {
+		ciphertextIDs[i] = PushCiphertext(ciphertext)
+	}
+
+	return SliceToCArray(ciphertextIDs, convertIntToCInt)
+}
+
+//export BatchDecrypt
+func BatchDecrypt(ciphertextIDs *C.int, numCiphertexts C.int, numThreads C.int) (*C.int, C.ulong) {
+	ctIDs := CArrayToSlice(ciphertextIDs, numCiphertexts, convertCIntToInt)
+
+	plaintexts := make([]*rlwe.Plaintext, len(ctIDs))
+	workers := numWorkers(int(numThreads), len(ctIDs))
+
+	var wg sync.WaitGroup
+	jobs := make(chan int, len(ctIDs))
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			decryptor := scheme.Decryptor.ShallowCopy()
+			for i := range jobs {
+				ciphertext := RetrieveCiphertext(ctIDs[i])
+				plaintext := ckks.NewPlaintext(*scheme.Params, ciphertext.Level())
+				decryptor.Decrypt(ciphertext, plaintext)
+				plaintexts[i] = plaintext
+			}
+		}()
+	}
+	for i := range ctIDs {
+		jobs <- i
+	}
+	close(jobs)
+	wg.Wait()
+
+	plaintextIDs := make([]int, len(plaintexts))
+	for i, plaintext := range plaintexts {
+		plaintextIDs[i] = PushPlaintext(plaintext)
+	}
+
+	return SliceToCArray(plaintextIDs, convertIntToCInt)
+}
@@ -3,6 +3,11 @@ class NewEvaluator:
         self.scheme = scheme
         self.backend = scheme.backend
 
+        # Bootstrapper construction is expensive (evaluation keys + DFT
+        # plaintexts), so memoize by (logp, slots). The scheme owns this
+        # cache; __del__ frees all backend bootstrappers at once.
+        self._boot_cache = {}
+
     def __del__(self):
         self.backend.DeleteBootstrappers()
 
@@ -10,7 +15,12 @@ class NewEvaluator:
         # We will wait to instantiate any bootstrapper until our bootstrap
         # placement algorithm determines they're necessary.
         logp = self.scheme.params.get_boot_logp()
-        return self.backend.NewBootstrapper(logp, slots)
+
+        cache_key = (tuple(logp), slots)
+        if cache_key not in self._boot_cache:
+            self._boot_cache[cache_key] = self.backend.NewBootstrapper(
+                logp, slots)
+        return self._boot_cache[cache_key]
     
     def bootstrap(self, ctxt, slots):
         return self.backend.Bootstrap(ctxt, slots)
\ No newline at end of file
@@ -1,9 +1,16 @@
+import os
+
 from .tensors import PlainTensor, CipherTensor
 
 class NewEncryptor:
     def __init__(self, scheme):
         self.scheme = scheme
         self.backend = scheme.backend
+
+        # Number of backend threads used for batched encrypt/decrypt;
+        # <= 0 lets the backend use all available cores.
+        self.num_threads = int(os.environ.get("ORION_ENCRYPT_THREADS", 0))
+
         self.new_encryptor()
         self.new_decryptor()
 
@@ -14,19 +21,17 @@ class NewEncryptor:
         self.backend.NewDecryptor()
 
     def encrypt(self, plaintensor):
-        ciphertext_ids = []
-        for ptxt in plaintensor.ids:
-            ciphertext_id = self.backend.Encrypt(ptxt)
-            ciphertext_ids.append(ciphertext_id)
+        # A single batched backend call avoids one FFI round-trip per
+        # ciphertext slot.
+        ciphertext_ids = self.backend.BatchEncrypt(
+            plaintensor.ids, self.num_threads)
 
         return CipherTensor(
             self.scheme, ciphertext_ids, plaintensor.shape, plaintensor.on_shape)
-    
+
     def decrypt(self, ciphertensor):
-        plaintext_ids = []
-        for ctxt in ciphertensor.ids:
-            plaintext_id = self.backend.Decrypt(ctxt)
-            plaintext_ids.append(plaintext_id)
+        plaintext_ids = self.backend.BatchDecrypt(
+            ciphertensor.ids, self.num_threads)
 
         return PlainTensor(
            self.scheme,  plaintext_ids, ciphertensor.shape, ciphertensor.on_shape
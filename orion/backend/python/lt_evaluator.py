@@ -1,13 +1,41 @@
+import os
+import struct
+import hashlib
+
 import h5py
-import torch
 import numpy as np
 
+# Zarr is an optional alternative store for the diagonals file: one file
+# per chunk and Blosc compression that runs outside the GIL, which suits
+# the many independent blocks written during compile.
+try:
+    import zarr
+    from numcodecs import Blosc
+except ImportError:
+    zarr = None
+
 from orion.backend.python.tensors import CipherTensor
 
+# Diagonals below this many elements are stored contiguous and
+# uncompressed; the filter pipeline and chunk b-tree cost more than they
+# save on ~16 KB of data. Larger ones get one chunk per diagonal, capped
+# at ~256 KB so the chunk cache stays effective.
+COMPRESS_MIN_ELEMS = 4096
+CHUNK_MAX_ELEMS = 65536
+
+# Chunk-cache settings for the diagonals file. h5py's 1 MB default evicts
+# compressed chunks that are still needed, forcing re-decompression; the
+# slot count is prime per the HDF5 guidance on hash collisions.
+DIAGS_RDCC = dict(
+    rdcc_nbytes=256 * 1024 * 1024,
+    rdcc_nslots=1_000_003,
+    rdcc_w0=0.75,
+)
+
 
 class NewEvaluator:
     def __init__(self, scheme):
-        self.scheme = scheme 
+        self.scheme = scheme
         self.params = scheme.params
         self.backend = scheme.backend
         self.evaluator = scheme.evaluator
@@ -17,25 +45,151 @@ class NewEvaluator:
         self.diags_path = self.params.get_diags_path()
         self.keys_path = self.params.get_keys_path()
 
+        self.diag_store = self.params.get_diag_store()
+        if self.diag_store == "zarr" and zarr is None:
+            raise ImportError(
+                "diag_store is set to 'zarr' but the zarr/numcodecs "
+                "packages are not installed. Install them or set "
+                "diag_store back to 'hdf5'."
+            )
+
+        # Diagonals are regenerable, so the default is LZF: much faster
+        # than gzip at a slightly worse ratio. Set diag_compression to
+        # "gzip" (with diag_compression_opts) in the orion parameters
+        # for archival-quality files.
+        self.compression = self.params.get_diag_compression()
+        self.compression_opts = self.params.get_diag_compression_opts()
+
         self.saved_rotation_keys = set()
+        self._diags_file = None
         self.new_evaluator()
 
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass # avoids errors for GC at program termination
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def new_evaluator(self):
         self.backend.NewLinearTransformEvaluator()
 
+    def _diags(self):
+        """Return a shared handle to the diagonals file, opened lazily.
+
+        Reopening the file for every layer pays h5py's C-level setup and
+        teardown per call, so the handle is kept open across save/load
+        operations. Load mode opens read-only: precomputed diagonals may
+        live on read-only media, and "a" would silently create an empty
+        file when the path is wrong instead of failing loudly. Call
+        close() (or use the evaluator as a context manager) to flush and
+        release the handle.
+
+        Zarr groups share the same access API (groups, datasets, attrs),
+        so call sites are store-agnostic except where noted.
+        """
+        mode = "r" if self.io_mode == "load" else "a"
+        if self.diag_store == "zarr":
+            if self._diags_file is None:
+                self._diags_file = zarr.open_group(self.diags_path, mode=mode)
+        elif self._diags_file is None or not self._diags_file.id.valid:
+            if self.io_mode == "load":
+                self._advise_sequential()
+            self._diags_file = h5py.File(self.diags_path, mode, **DIAGS_RDCC)
+        return self._diags_file
+
+    def _advise_sequential(self):
+        """Hint the kernel to read ahead through the diagonals file.
+
+        Loads stream whole layers in order, so on a cold page cache
+        POSIX_FADV_SEQUENTIAL/WILLNEED kicks off readahead before h5py
+        issues its first small read. No-op where fadvise is unavailable
+        (e.g. macOS) or the file doesn't exist yet.
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        try:
+            fd = os.open(self.diags_path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.posix_fadvise(
+                fd, 0, 0, os.POSIX_FADV_SEQUENTIAL | os.POSIX_FADV_WILLNEED
+            )
+        finally:
+            os.close(fd)
+
+    def close(self):
+        # Zarr directory stores write through; only HDF5 holds an open
+        # file handle that needs explicit closing.
+        if (self.diag_store != "zarr" and self._diags_file is not None
+                and self._diags_file.id.valid):
+            self._diags_file.close()
+        self._diags_file = None
+
+    def repack(self):
+        """Rewrite the diagonals file into a fresh one and swap it in.
+
+        HDF5 never reclaims freed space inside a file, so repeatedly
+        re-saving layers leaves holes that bloat the file and scatter
+        later reads. Copying every object into a new file (what the
+        `h5repack` tool does) lays the data out contiguously; the copy
+        then atomically replaces the original. Safe to call after a
+        save-mode compile; the handle reopens lazily on next access.
+        """
+        if self.diag_store == "zarr":
+            return # chunk-per-file stores don't fragment
+
+        self.close()
+        packed_path = self.diags_path + ".repack"
+        with h5py.File(self.diags_path, "r") as src, \
+                h5py.File(packed_path, "w") as dst:
+            for name in src:
+                src.copy(name, dst)
+            for name, value in src.attrs.items():
+                dst.attrs[name] = value
+        os.replace(packed_path, self.diags_path)
+
+    def _diag_dataset_opts(self, num_elems):
+        """Chunking/compression settings for a diagonal of `num_elems`."""
+        if num_elems < COMPRESS_MIN_ELEMS:
+            return {}
+        chunks = (min(num_elems, CHUNK_MAX_ELEMS),)
+        if self.diag_store == "zarr":
+            return dict(
+                chunks=chunks,
+                compressor=Blosc(cname="lz4", shuffle=Blosc.BITSHUFFLE),
+            )
+        return dict(
+            chunks=chunks,
+            compression=self.compression,
+            compression_opts=self.compression_opts,
+            shuffle=True,
+        )
+
     def generate_transforms(self, linear_layer):
         layer_name = linear_layer.name
         diagonals = linear_layer.diagonals 
         level = linear_layer.level
         bsgs_ratio = linear_layer.bsgs_ratio
 
-        # Generate all linear transforms block by block.
-        lintransf_ids = {}        
-        for (row, col), diags in diagonals.items(): 
-            diags_idxs, diags_data = [], []
-            for idx, diag in diags.items(): 
-                diags_idxs.append(idx)
-                diags_data.extend(diag)
+        # Generate all linear transforms block by block. Each block's
+        # diagonals are flattened into one contiguous float32 buffer
+        # right before its backend call, so only one block's scratch is
+        # alive at a time. The loop is serial by design: transform and
+        # key ids come from an unsynchronized allocator, and the
+        # rotation-key and plaintext saves share one HDF5 file.
+        lintransf_ids = {}
+        for (row, col), diags in diagonals.items():
+            diags_idxs = list(diags.keys())
+            diags_data = np.concatenate(
+                [np.asarray(diag, dtype=np.float32) for diag in diags.values()]
+            )
 
             lintransf_id = self.backend.GenerateLinearTransform(
                 diags_idxs, diags_data, level, bsgs_ratio, self.io_mode
@@ -82,6 +236,30 @@ class NewEvaluator:
                     finally:
                         self.backend.FreeCArray(ptr)
 
+    def _layer_fingerprint(self, linear_layer):
+        """Digest of everything _verify_layer_compatibility checks.
+
+        Hashing the packed metadata lets verification succeed on a single
+        string comparison; the per-field checks only run (to produce a
+        readable mismatch report) when the digests differ.
+        """
+        h = hashlib.blake2b(digest_size=32)
+        h.update(self.embed_method.encode())
+        h.update(struct.pack(
+            "<q4d",
+            int(linear_layer.output_rotations),
+            float(linear_layer.input_min),
+            float(linear_layer.input_max),
+            float(linear_layer.output_min),
+            float(linear_layer.output_max),
+        ))
+        h.update(np.asarray(tuple(linear_layer.input_shape),
+                            dtype=np.int64).tobytes())
+        h.update(np.asarray(tuple(linear_layer.output_shape),
+                            dtype=np.int64).tobytes())
+        h.update(linear_layer.on_bias.detach().numpy().tobytes())
+        return h.hexdigest()
+
     def save_transforms(self, linear_layer):
         layer_name = linear_layer.name
         diagonals = linear_layer.diagonals 
@@ -95,29 +273,96 @@ class NewEvaluator:
         output_max = linear_layer.output_max
 
         print("└── saving... ", end="", flush=True)
-        with h5py.File(self.diags_path, "a") as f:
-            layer = f.require_group(layer_name)
-
-            layer.create_dataset("embedding_method", data=self.embed_method)
-            layer.create_dataset("output_rotations", data=output_rotations)
-            layer.create_dataset("on_bias", data=on_bias.numpy())
-            layer.create_dataset("input_shape", data=list(input_shape))
-            layer.create_dataset("output_shape", data=list(output_shape))
-            layer.create_dataset("input_min", data=input_min.item())
-            layer.create_dataset("input_max", data=input_max.item())
-            layer.create_dataset("output_min", data=output_min.item())
-            layer.create_dataset("output_max", data=output_max.item())
-
-            diags_group = layer.require_group("diagonals")
-            for (row, col), diags in diagonals.items():
-                block_idx = f"{row}_{col}"
-                block_diags_group = diags_group.create_group(block_idx)
-                
-                # Iterate over all diagonals in the block and save
-                for diag_idx, diag_data in diags.items():
-                    block_diags_group.create_dataset(str(diag_idx), data=diag_data)
-                    diags[diag_idx] = [] # delete after saving
-
+        f = self._diags()
+        layer = f.require_group(layer_name)
+
+        # Scalars and shapes live in the group's attributes: attrs sit in
+        # the group header, so reading them back avoids a dataset open per
+        # field. Only on_bias is large enough to warrant a real dataset.
+        layer.attrs["embedding_method"] = self.embed_method
+        layer.attrs["output_rotations"] = output_rotations
+        layer.attrs["input_shape"] = list(input_shape)
+        layer.attrs["output_shape"] = list(output_shape)
+        layer.attrs["input_min"] = input_min.item()
+        layer.attrs["input_max"] = input_max.item()
+        layer.attrs["output_min"] = output_min.item()
+        layer.attrs["output_max"] = output_max.item()
+        layer.attrs["fingerprint"] = self._layer_fingerprint(linear_layer)
+
+        # .numpy() on a GPU or non-contiguous tensor silently syncs and
+        # copies; insist on the zero-copy case so that never sneaks into
+        # the save path, then write the buffer directly.
+        if on_bias.device.type != "cpu" or not on_bias.is_contiguous():
+            raise ValueError(
+                f"Layer '{layer_name}' on_bias must be a contiguous CPU "
+                "tensor before saving its transforms."
+            )
+        on_bias_np = on_bias.detach().numpy()
+        dset = layer.create_dataset(
+            "on_bias", shape=on_bias_np.shape, dtype=on_bias_np.dtype
+        )
+        if self.diag_store == "zarr":
+            dset[...] = on_bias_np
+        else:
+            dset.write_direct(on_bias_np)
+
+        diags_group = layer.require_group("diagonals")
+
+        # Record the (row, col) block coordinates once as an attribute;
+        # the loader then walks this index instead of enumerating group
+        # names and parsing them back into ints. (Plain lists, so the
+        # same write works for both the HDF5 and zarr stores.)
+        diags_group.attrs["block_index"] = [
+            [row, col] for (row, col) in diagonals
+        ]
+
+        for (row, col), diags in diagonals.items():
+            block_idx = f"{row}_{col}"
+            block_group = diags_group.create_group(block_idx)
+
+            # Diagonals within a block all span the same slot count,
+            # so the whole block stacks into one (num_diags, diag_len)
+            # dataset and hits h5py once, instead of paying dataset
+            # creation and a filter pipeline per diagonal. float32 is
+            # what packing produced; stacking Python float lists without
+            # the explicit dtype would silently re-inflate to float64
+            # and double both file size and read bandwidth.
+            stacked = np.asarray(list(diags.values()), dtype=np.float32)
+            opts = self._diag_dataset_opts(stacked.shape[1])
+            if opts:
+                opts["chunks"] = (1, *opts["chunks"])
+
+            # Mirror the stacked dataset's geometry in block attributes
+            # so the loader can size its destination buffer from header
+            # reads alone.
+            block_group.attrs["num_diags"] = stacked.shape[0]
+            block_group.attrs["diag_len"] = stacked.shape[1]
+            block_group.attrs["dtype"] = str(stacked.dtype)
+
+            block_group.create_dataset("diag_idxs", data=list(diags.keys()))
+
+            # Creating the dataset empty and filling it with write_direct
+            # skips h5py's dtype inference and intermediate copy. Zarr
+            # has no write_direct; plain assignment is its bulk path.
+            dset = block_group.create_dataset(
+                "diags", shape=stacked.shape, dtype=stacked.dtype, **opts
+            )
+            if self.diag_store == "zarr":
+                dset[...] = stacked
+            else:
+                dset.write_direct(stacked)
+            del stacked
+
+            # The block is on disk now; drop the Python-side lists in one
+            # go rather than rebinding each entry. compile() reloads the
+            # diagonals from file before they are needed again.
+            diags.clear()
+
+        # The shared handle stays open across layers; flush so the data
+        # is durable even if the process dies mid-compile. (Zarr writes
+        # through to its store and has nothing to flush.)
+        if self.diag_store != "zarr":
+            f.flush()
         print("done!")
 
     def load_transforms(self, linear_layer):
@@ -127,20 +372,41 @@ class NewEvaluator:
         on_bias = linear_layer.on_bias
         output_rotations = linear_layer.output_rotations
 
-        with h5py.File(self.diags_path, "a") as f:
-            layer = f[layer_name]
-
-            # Load the diagonals back into the correct struct
-            all_diagonals = {}
-            diag_group = layer["diagonals"]
-            for block in diag_group:
-                row, col = map(int, block.split("_")) # 0_1 -> (0,1)
-                diags = {}
-                block_group = diag_group[block]
-                for diag_idx in block_group:
-                    diag_data = block_group[diag_idx][:]
-                    diags[int(diag_idx)] = diag_data 
-                all_diagonals[(row, col)] = diags
+        f = self._diags()
+        layer = f[layer_name]
+
+        # Load the diagonals back into the correct struct. The block
+        # index attribute gives the (row, col) coordinates directly;
+        # _verify_layer_compatibility has already rejected files written
+        # in the old per-diagonal layout, so it is always present here.
+        all_diagonals = {}
+        diag_group = layer["diagonals"]
+        blocks = [
+            (int(row), int(col)) for row, col in diag_group.attrs["block_index"]
+        ]
+
+        for row, col in blocks:
+            block_group = diag_group[f"{row}_{col}"]
+
+            # Two bulk reads per block: the index vector and the
+            # stacked (num_diags, diag_len) matrix. read_direct fills a
+            # preallocated buffer, avoiding the temporary __getitem__
+            # would create.
+            diag_idxs = block_group["diag_idxs"][:]
+            dset = block_group["diags"]
+            if self.diag_store == "zarr":
+                diag_data = dset[:]
+            else:
+                # The destination buffer is sized from the block attrs
+                # (header reads) rather than inspecting the dataset's
+                # shape and dtype.
+                attrs = block_group.attrs
+                shape = (int(attrs["num_diags"]), int(attrs["diag_len"]))
+                diag_data = np.empty(shape, dtype=np.dtype(attrs["dtype"]))
+                dset.read_direct(diag_data)
+            all_diagonals[(row, col)] = {
+                int(idx): diag_data[i] for i, idx in enumerate(diag_idxs)
+            }
 
         return all_diagonals, on_bias, output_rotations
 
@@ -149,14 +415,25 @@ class NewEvaluator:
         out_shape = linear_layer.output_shape
         fhe_out_shape = linear_layer.fhe_output_shape 
 
-        # Order-preserving flatten that can be mapped back to 
-        # (row, col) format in backend via len(in_ctensor.ids)
-        transform_ids = np.array(list(linear_layer.transform_ids.values()))
+        # Order-preserving flatten that can be mapped back to
+        # (row, col) format in backend via len(in_ctensor.ids). The
+        # flattened array is memoized on the layer since this runs once
+        # per inference; compile() installs a fresh transform_ids dict,
+        # so its identity doubles as the invalidation check.
+        cached = getattr(linear_layer, "_transform_ids_cache", None)
+        if cached is None or cached[0] is not linear_layer.transform_ids:
+            cached = (
+                linear_layer.transform_ids,
+                np.array(list(linear_layer.transform_ids.values())),
+            )
+            linear_layer._transform_ids_cache = cached
+        flat_ids = cached[1]
+
         cols = len(in_ctensor)
-        rows = len(transform_ids) // cols
+        rows = len(flat_ids) // cols
 
         # Now we can perform a blocked linear transform
-        transform_ids = transform_ids.reshape(rows, cols)
+        transform_ids = flat_ids.reshape(rows, cols)
         cts_out = []
         for i in range(rows):
             ct_out = None
@@ -192,7 +469,9 @@ class NewEvaluator:
 
         # -------- Current network values -------- #
 
-        curr_embed_method = linear_layer.scheme.params.get_embedding_method()
+        # The embedding method is fixed at scheme setup; use the value
+        # cached on the evaluator instead of re-querying params per layer.
+        curr_embed_method = self.embed_method
         curr_output_rotations = linear_layer.output_rotations
         curr_on_bias = linear_layer.on_bias
         curr_input_shape = linear_layer.input_shape 
@@ -204,94 +483,118 @@ class NewEvaluator:
 
         # ------- Previous network values ------- #
 
-        with h5py.File(self.diags_path, "r") as f:
+        f = self._diags()
 
-            # Check if the layer exists in the h5py file
-            if layer_name not in f:
-                raise ValueError(
-                    f"Layer '{layer_name}' not found in file {self.diags_path}. " + 
-                    "First set IO mode in parameters YAML file to `save`."
-                )
-            
-            layer = f[layer_name]
+        # Check if the layer exists in the h5py file
+        if layer_name not in f:
+            raise ValueError(
+                f"Layer '{layer_name}' not found in file {self.diags_path}. " + 
+                "First set IO mode in parameters YAML file to `save`."
+            )
             
-            last_embed_method = layer["embedding_method"][()].decode("utf-8")
-            last_output_rotations = layer["output_rotations"][()]
-            last_on_bias = torch.tensor(layer["on_bias"][:])
-            last_input_shape = torch.Size(layer["input_shape"][:])
-            last_output_shape = torch.Size(layer["output_shape"][:])
-            last_input_min = layer["input_min"][()]
-            last_input_max = layer["input_max"][()]
-            last_output_min = layer["output_min"][()]
-            last_output_max = layer["output_max"][()]
-
-            # Check each parameter and collect mismatches
-            mismatches = []
-                            
-            if curr_on_bias.shape != last_on_bias.shape:
-                mismatches.append(f"on_bias: shape mismatch")
-            elif not torch.allclose(curr_on_bias, last_on_bias):
-                mismatches.append(f"on_bias: values mismatch")
+        layer = f[layer_name]
+
+        # Files written in the old layout (per-field datasets, one
+        # dataset per diagonal) can't be loaded by the readers below;
+        # spot them up front by the missing metadata attributes and ask
+        # for a re-save instead of surfacing a raw KeyError later.
+        if "embedding_method" not in layer.attrs:
+            raise ValueError(
+                f"Layer '{layer_name}' in file {self.diags_path} was saved "
+                "in an older, incompatible layout. First set IO mode in "
+                "parameters YAML file to `save` to regenerate the file."
+            )
+
+        # Fast path: a matching fingerprint covers every field below in
+        # one comparison. Fall through on mismatch to report which field
+        # changed.
+        if (layer.attrs.get("fingerprint") ==
+                self._layer_fingerprint(linear_layer)):
+            return
+
+        # Saved values are compared as plain numpy arrays/tuples; there is
+        # no need to round-trip them through torch just for equality. The
+        # scalar metadata are attributes on the layer group, so these are
+        # header reads rather than dataset opens.
+        last_embed_method = layer.attrs["embedding_method"]
+        last_output_rotations = layer.attrs["output_rotations"]
+        last_on_bias = layer["on_bias"][:]
+        last_input_shape = tuple(layer.attrs["input_shape"])
+        last_output_shape = tuple(layer.attrs["output_shape"])
+        last_input_min = layer.attrs["input_min"]
+        last_input_max = layer.attrs["input_max"]
+        last_output_min = layer.attrs["output_min"]
+        last_output_max = layer.attrs["output_max"]
+
+        # Check each parameter and collect mismatches
+        mismatches = []
+
+        curr_on_bias_np = curr_on_bias.detach().numpy()
+        if tuple(curr_on_bias.shape) != last_on_bias.shape:
+            mismatches.append(f"on_bias: shape mismatch")
+        elif not (np.array_equal(curr_on_bias_np, last_on_bias) or
+                  np.allclose(curr_on_bias_np, last_on_bias)):
+            mismatches.append(f"on_bias: values mismatch")
             
-            # Simple equality checks
-            if curr_output_rotations != last_output_rotations:
-                mismatches.append(f"output_rotations mismatch")
+        # Simple equality checks
+        if curr_output_rotations != last_output_rotations:
+            mismatches.append(f"output_rotations mismatch")
 
-            if curr_input_shape != last_input_shape:
-                mismatches.append(f"input_shape mismatch")
+        if curr_input_shape != last_input_shape:
+            mismatches.append(f"input_shape mismatch")
             
-            if curr_output_shape != last_output_shape:
-                mismatches.append(f"output_shape mismatch")
+        if curr_output_shape != last_output_shape:
+            mismatches.append(f"output_shape mismatch")
             
-            if curr_embed_method != last_embed_method:
-                mismatches.append(f"embedding_method mismatch")
+        if curr_embed_method != last_embed_method:
+            mismatches.append(f"embedding_method mismatch")
             
-            if curr_input_min != last_input_min:
-                mismatches.append(f"input_min mismatch")
+        if curr_input_min != last_input_min:
+            mismatches.append(f"input_min mismatch")
             
-            if curr_input_max != last_input_max:
-                mismatches.append(f"input_max mismatch")
+        if curr_input_max != last_input_max:
+            mismatches.append(f"input_max mismatch")
             
-            if curr_output_min != last_output_min:
-                mismatches.append(f"output_min mismatch")
+        if curr_output_min != last_output_min:
+            mismatches.append(f"output_min mismatch")
             
-            if curr_output_max != last_output_max:
-                mismatches.append(f"output_max mismatch")
+        if curr_output_max != last_output_max:
+            mismatches.append(f"output_max mismatch")
             
-            # If there are mismatches, raise a detailed error
-            if mismatches:
-                error_msg = "Saved network does not match currently instantiated network: "
-                error_msg += ", ".join(mismatches)
-                error_msg += ". First set IO mode in parameters YAML file to `save` to "
-                error_msg += "override existing data. Then loading will work."
+        # If there are mismatches, raise a detailed error
+        if mismatches:
+            error_msg = "Saved network does not match currently instantiated network: "
+            error_msg += ", ".join(mismatches)
+            error_msg += ". First set IO mode in parameters YAML file to `save` to "
+            error_msg += "override existing data. Then loading will work."
                 
-                raise ValueError(error_msg)
+            raise ValueError(error_msg)
             
     def save_plaintext_diagonals(self, layer_name, lintransf_id, row, col, diag_idxs):
-        with h5py.File(self.diags_path, "a") as f:
-            layer = f[layer_name]
-            plaintext_group = layer.require_group("plaintexts")
-            block_idx = f"{row}_{col}"
-            block_group = plaintext_group.create_group(block_idx)
+        f = self._diags()
+        layer = f[layer_name]
+        plaintext_group = layer.require_group("plaintexts")
+        block_idx = f"{row}_{col}"
+        block_group = plaintext_group.create_group(block_idx)
 
-            for diag_idx in diag_idxs:
-                diag_serial, diag_ptr = self.backend.SerializeDiagonal(lintransf_id, diag_idx)
-                block_group.create_dataset(str(diag_idx), data=diag_serial)
+        for diag_idx in diag_idxs:
+            diag_serial, diag_ptr = self.backend.SerializeDiagonal(lintransf_id, diag_idx)
+            block_group.create_dataset(str(diag_idx), data=diag_serial)
 
-                # Now that it's saved, we'll free the memory
-                self.backend.FreeCArray(diag_ptr)
+            # Now that it's saved, we'll free the memory
+            self.backend.FreeCArray(diag_ptr)
 
     def load_plaintext_diagonals(self, layer_name, row, col, transform_id):
-        with h5py.File(self.diags_path, "r") as f:
-            layer = f[layer_name]
-            ptxt_group = layer["plaintexts"]
-            block = ptxt_group[f"{row}_{col}"]
-
-            for diag_idx in block:
-                serial_diag = block[diag_idx][()]
-                self.backend.LoadPlaintextDiagonal(
-                    serial_diag, transform_id, int(diag_idx)
-                )
+        f = self._diags()
+        layer = f[layer_name]
+        ptxt_group = layer["plaintexts"]
+        block = ptxt_group[f"{row}_{col}"]
+
+        for diag_idx in block:
+            serial_diag = block[diag_idx][...]
+            self.backend.LoadPlaintextDiagonal(
+                serial_diag, transform_id, int(diag_idx)
+            )
     
     def load_rotation_keys(self, transform_id):
         keys = self.get_required_rotation_keys(transform_id)
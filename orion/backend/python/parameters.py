@@ -1,4 +1,5 @@
 import os
+import shutil
 from typing import Literal, List
 from dataclasses import dataclass, field
 
@@ -75,6 +76,9 @@ class OrionParameters:
     embedding_method: Literal["hybrid", "square"] = "hybrid"
     backend: Literal["lattigo", "openfhe", "heaan"] = "lattigo"
     io_mode: Literal["none", "save", "load"] = "none"
+    diag_store: Literal["hdf5", "zarr"] = "hdf5"
+    diag_compression: str = "lzf"
+    diag_compression_opts: int = None
     diags_path: str = ""
     keys_path: str = ""
 
@@ -183,6 +187,15 @@ class NewParameters:
     def get_io_mode(self):
         return self.orion_params.io_mode.lower()
 
+    def get_diag_store(self):
+        return self.orion_params.diag_store.lower()
+
+    def get_diag_compression(self):
+        return self.orion_params.diag_compression.lower()
+
+    def get_diag_compression_opts(self):
+        return self.orion_params.diag_compression_opts
+
     def get_boot_logp(self):
         return self.ckks_params.boot_logp
 
@@ -193,7 +206,21 @@ class NewParameters:
         if self.get_io_mode() == "save" and path:
             print(f"Deleting existing {file_type} at {path}")
             abs_path = os.path.abspath(os.path.join(os.getcwd(), path))
-            if os.path.exists(abs_path):
+            if os.path.isdir(abs_path):
+                # Only a zarr diagonal store is ever a directory. Refuse
+                # to recursively delete anything we can't identify as one
+                # (zarr marks its root with a .zgroup entry), so a
+                # mistyped path never wipes an unrelated tree.
+                if (self.get_diag_store() == "zarr" and
+                        os.path.exists(os.path.join(abs_path, ".zgroup"))):
+                    shutil.rmtree(abs_path)
+                else:
+                    raise IsADirectoryError(
+                        f"Refusing to delete directory {abs_path}: it does "
+                        f"not look like a zarr store. Check the {file_type} "
+                        "path in the parameters YAML file."
+                    )
+            elif os.path.exists(abs_path):
                 os.remove(abs_path)
 
     def reset_stored_diags(self):
@@ -307,7 +307,11 @@ class Scheme:
             if isinstance(module, Module):
                 print(f"├── {node} @ level={module.level}", flush=True)
                 module.compile()
-                
+
+        # Per-layer disk I/O is done; release the shared diagonals file
+        # handle (it reopens lazily if inference needs to stream data).
+        self.lt_evaluator.close()
+
         return input_level # level at which to encrypt the input.
 
     def _check_initialization(self):